@@ -83,6 +83,55 @@ TEMPLATES = [
 WSGI_APPLICATION = "app.wsgi.application"
 CELERY_BROKER_URL = "redis://redis:6379/0"
 CELERY_RESULT_BACKEND = "redis://redis:6379/0"
+# Job outcomes live on the Job row, so don't store task results in Redis
+CELERY_TASK_IGNORE_RESULT = True
+# Keep enough pooled broker connections for every gunicorn request thread to
+# publish without opening a new connection
+CELERY_BROKER_POOL_LIMIT = int(
+    os.getenv(
+        "CELERY_BROKER_POOL_LIMIT", str(2 * int(os.getenv("GUNICORN_THREADS", "8")))
+    )
+)
+
+# process_guideline spends nearly all of its time waiting on OpenAI, so the
+# worker runs a gevent pool (see docker-compose.yml) with many more slots than
+# CPU cores. The pool itself is chosen on the command line; it is only read
+# here to pick a concurrency default that suits it, since 200 slots would mean
+# 200 processes under prefork. None lets Celery use the number of CPU cores.
+_celery_worker_pool = os.getenv("CELERY_WORKER_POOL", "gevent")
+if os.getenv("CELERY_WORKER_CONCURRENCY"):
+    CELERY_WORKER_CONCURRENCY = int(os.environ["CELERY_WORKER_CONCURRENCY"])
+elif _celery_worker_pool in ("gevent", "eventlet"):
+    CELERY_WORKER_CONCURRENCY = 200
+else:
+    CELERY_WORKER_CONCURRENCY = None
+# Reserve only one message per pool slot so a worker doesn't sit on queued
+# jobs behind long-running OpenAI calls while other workers are idle
+CELERY_WORKER_PREFETCH_MULTIPLIER = int(
+    os.getenv("CELERY_WORKER_PREFETCH_MULTIPLIER", "1")
+)
+
+# Run the summary + checklist chain as a single JSON-mode completion.
+# Set to False to fall back to the legacy two-request chain.
+OPENAI_COMBINED_CHAIN = os.getenv("OPENAI_COMBINED_CHAIN", "True").lower() == "true"
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+# The cache gets its own Redis database, apart from the Celery broker's
+# (db 0): cache.clear() runs FLUSHDB, which must never drop queued tasks
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("CACHE_URL", "redis://redis:6379/1"),
+    }
+}
+
+# Job status changes are published to Redis pub/sub and streamed to clients
+# by the /jobs/<event_id>/events/ endpoint
+JOB_EVENTS_ENABLED = os.getenv("JOB_EVENTS_ENABLED", "True").lower() == "true"
+JOB_EVENTS_REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
 
 
 # Database
@@ -98,8 +147,21 @@ DATABASES = {
         "PORT": "5432",
         "OPTIONS": {
             "connect_timeout": 10,
+            # Django's built-in psycopg 3 connection pool: request threads and
+            # Celery greenlets borrow from a bounded, per-process set of open
+            # connections instead of connecting per request. Requests and
+            # tasks only hold a connection for their queries, so a few per
+            # process go a long way; threads beyond that wait for one. The
+            # default keeps a whole default deployment within Postgres'
+            # max_connections of 100 (see "Database connections" in the
+            # README).
+            "pool": {
+                "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+                "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "5")),
+            },
         },
-        "CONN_MAX_AGE": 60,
+        # Pooled connections are returned to the pool rather than persisted
+        "CONN_MAX_AGE": 0,
     }
 }
 
@@ -155,4 +217,8 @@ SPECTACULAR_SETTINGS = {
     "DESCRIPTION": "A minimal backend API for processing clinical guidelines with GPT",
     "VERSION": "1.0.0",
     "SERVE_INCLUDE_SCHEMA": False,
+    "POSTPROCESSING_HOOKS": [
+        "drf_spectacular.hooks.postprocess_schema_enums",
+        "jobs.schema.add_job_events_path",
+    ],
 }
@@ -10,9 +10,33 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": ":memory:",  # Use in-memory database for faster tests
+        "TEST": {"NAME": ":memory:"},
     }
 }
 
+
+class DisableMigrations:
+    """Build the test schema straight from the models instead of migrating."""
+
+    def __contains__(self, item: str) -> bool:
+        return True
+
+    def __getitem__(self, item: str) -> None:
+        return None
+
+
+MIGRATION_MODULES = DisableMigrations()
+
+# Use a local in-memory cache instead of Redis
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# Don't publish job status changes to Redis
+JOB_EVENTS_ENABLED = False
+
 # Disable Celery for testing
 CELERY_TASK_ALWAYS_EAGER = True
 CELERY_TASK_EAGER_PROPAGATES = True
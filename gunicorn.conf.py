@@ -0,0 +1,19 @@
+"""
+Gunicorn configuration for the web service.
+
+Gunicorn loads this file automatically from the working directory. Clients
+poll GET /jobs/<event_id>/ until their job finishes, so requests are short
+and spend most of their time waiting on Postgres or Redis; threaded workers
+let each process serve many of them at once.
+"""
+
+import multiprocessing
+import os
+
+# 2 * CPU + 1 is gunicorn's rule for sync workers; each gthread worker already
+# serves `threads` requests at once, so one process per core (plus one) is
+# enough, capped so large hosts don't multiply request threads and database
+# connections without bound
+workers = int(os.getenv("GUNICORN_WORKERS", min(multiprocessing.cpu_count() + 1, 8)))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
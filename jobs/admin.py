@@ -10,3 +10,12 @@ class JobAdmin(admin.ModelAdmin):
     search_fields = ("title", "guideline_text", "summary")
     readonly_fields = ("event_id", "created_at", "updated_at")
     ordering = ("-created_at",)
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        # Only load the columns shown on the changelist; guideline_text,
+        # summary and checklist can be large. The change form needs them all.
+        match = request.resolver_match
+        if match is not None and match.url_name == "jobs_job_changelist":
+            queryset = queryset.only(*self.list_display)
+        return queryset
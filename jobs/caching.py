@@ -0,0 +1,46 @@
+"""
+Best-effort access to the shared cache.
+
+The cache only saves work (GPT calls, detail queries); the database is the
+source of truth. These helpers log cache errors, such as Redis being
+unreachable, and report a miss instead of failing the caller.
+"""
+
+import logging
+from typing import Any, Optional
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+def cache_get(key: str) -> Optional[Any]:
+    """
+    Read a value from the cache.
+
+    Args:
+        key: The cache key
+
+    Returns:
+        The cached value, or None on a miss or cache error
+    """
+    try:
+        return cache.get(key)
+    except Exception as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return None
+
+
+def cache_set(key: str, value: Any, timeout: int) -> None:
+    """
+    Write a value to the cache, ignoring cache errors.
+
+    Args:
+        key: The cache key
+        value: The value to store
+        timeout: Seconds until the value expires
+    """
+    try:
+        cache.set(key, value, timeout=timeout)
+    except Exception as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
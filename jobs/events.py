@@ -0,0 +1,140 @@
+"""
+Job status push notifications.
+
+process_guideline publishes every status change of a job to a Redis pub/sub
+channel, and JobEventsView relays those messages to clients as Server-Sent
+Events, so clients waiting for a result don't have to poll JobDetailView.
+Publishing happens in the (synchronous) worker; subscribing happens in the
+async view, so the two sides use redis-py's sync and asyncio clients.
+"""
+
+import json
+import logging
+import uuid
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import redis
+from django.conf import settings
+from redis.asyncio import ConnectionPool as AsyncConnectionPool
+from redis.asyncio.client import PubSub as AsyncPubSub
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def get_redis() -> redis.Redis:
+    """
+    Get the shared Redis client used for job status pub/sub.
+
+    Built lazily, like the OpenAI client, so importing this module doesn't
+    open a connection pool.
+
+    Returns:
+        A Redis client for JOB_EVENTS_REDIS_URL
+    """
+    return redis.Redis.from_url(settings.JOB_EVENTS_REDIS_URL)
+
+
+def channel_name(event_id: uuid.UUID) -> str:
+    """Return the pub/sub channel carrying status changes for a job."""
+    return f"job-events:{event_id}"
+
+
+def job_payload(
+    event_id: uuid.UUID,
+    status: str,
+    summary: Optional[str] = None,
+    checklist: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Build a job state payload, in the same shape JobDetailView returns.
+
+    Args:
+        event_id: The unique identifier of the job
+        status: The job's status
+        summary: The generated summary, if any
+        checklist: The generated checklist, if any
+
+    Returns:
+        The payload dict
+    """
+    return {
+        "event_id": str(event_id),
+        "status": status,
+        "summary": summary,
+        "checklist": checklist,
+    }
+
+
+def publish_status(
+    event_id: uuid.UUID,
+    status: str,
+    summary: Optional[str] = None,
+    checklist: Optional[List[str]] = None,
+) -> None:
+    """
+    Notify subscribers of a job's new status.
+
+    Publishing is best effort: the Job row stays the source of truth, so a
+    Redis error is logged rather than failing the caller.
+
+    Args:
+        event_id: The unique identifier of the job
+        status: The job's new status
+        summary: The generated summary, if any
+        checklist: The generated checklist, if any
+    """
+    if not settings.JOB_EVENTS_ENABLED:
+        return
+
+    payload = job_payload(event_id, status, summary, checklist)
+    try:
+        get_redis().publish(channel_name(event_id), json.dumps(payload))
+    except redis.RedisError as e:
+        logger.warning(f"Could not publish status {status} for job {event_id}: {e}")
+
+
+async def subscribe(event_id: uuid.UUID) -> Optional[AsyncPubSub]:
+    """
+    Subscribe to a job's status changes from async code.
+
+    Each subscription gets its own single-connection pool, since a pub/sub
+    connection can't be shared and asyncio connections are bound to the
+    event loop that opened them. Release it with close_subscription().
+
+    Args:
+        event_id: The unique identifier of the job
+
+    Returns:
+        A subscribed PubSub, or None if job events are disabled or Redis is
+        unavailable
+    """
+    if not settings.JOB_EVENTS_ENABLED:
+        return None
+
+    pool = AsyncConnectionPool.from_url(
+        settings.JOB_EVENTS_REDIS_URL, max_connections=1
+    )
+    pubsub = AsyncPubSub(pool, ignore_subscribe_messages=True)
+    try:
+        await pubsub.subscribe(channel_name(event_id))
+    except redis.RedisError as e:
+        logger.warning(f"Could not subscribe to job {event_id} events: {e}")
+        await close_subscription(pubsub)
+        return None
+    return pubsub
+
+
+async def close_subscription(pubsub: AsyncPubSub) -> None:
+    """Unsubscribe and close the connection pool behind a subscription."""
+    try:
+        await pubsub.aclose()
+        await pubsub.connection_pool.disconnect()
+    except redis.RedisError as e:
+        logger.warning(f"Could not close job events subscription: {e}")
+
+
+def format_event(payload: Dict[str, Any]) -> str:
+    """Encode a payload as a single Server-Sent Events message."""
+    return f"data: {json.dumps(payload)}\n\n"
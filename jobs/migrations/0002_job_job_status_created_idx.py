@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-10-15 22:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                fields=["status", "-created_at"], name="job_status_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations
+
+
+def create_checklist_gin_index(apps, schema_editor):
+    # GIN indexes are Postgres-only; SQLite (used in tests) has no equivalent
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS job_checklist_gin_idx "
+        "ON jobs_job USING gin (checklist jsonb_path_ops)"
+    )
+
+
+def drop_checklist_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX CONCURRENTLY IF EXISTS job_checklist_gin_idx")
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("jobs", "0002_job_job_status_created_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_checklist_gin_index, drop_checklist_gin_index),
+    ]
@@ -8,9 +8,11 @@ class Job(models.Model):
     """
     Model representing a guideline processing job.
 
-    Each job processes clinical guideline text through a two-step GPT chain:
+    Each job processes clinical guideline text through a GPT chain:
     1. Summarize the guideline text
     2. Generate a checklist from the summary
+
+    Both steps are normally answered by a single JSON-mode request.
     """
 
     STATUS_CHOICES = [
@@ -26,6 +28,8 @@ class Job(models.Model):
     title: str = models.CharField(max_length=255)
     guideline_text: str = models.TextField(blank=False, null=False)
     summary: Optional[str] = models.TextField(null=True, blank=True)
+    # Stored as jsonb on Postgres, where migration 0003 adds a GIN index so
+    # membership queries like checklist__contains=["..."] can use it
     checklist: Optional[List[str]] = models.JSONField(null=True, blank=True)
     status: str = models.CharField(
         max_length=20, choices=STATUS_CHOICES, default="queued"
@@ -33,5 +37,13 @@ class Job(models.Model):
     created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
     updated_at: models.DateTimeField = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Backs the admin changelist's status filter and -created_at ordering
+            models.Index(
+                fields=["status", "-created_at"], name="job_status_created_idx"
+            ),
+        ]
+
     def __str__(self) -> str:
         return f"Job {self.event_id} - {self.title}"
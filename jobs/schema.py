@@ -0,0 +1,70 @@
+"""
+OpenAPI schema additions for endpoints drf-spectacular can't introspect.
+"""
+
+from typing import Any, Dict
+
+_JOB_EVENTS_OPERATION = {
+    "operationId": "jobs_events_retrieve",
+    "summary": "Stream job status changes",
+    "description": (
+        "Streams the job's state as Server-Sent Events: the current state "
+        "first, then one event per status change. Each event's data has the "
+        "same shape as the job detail response. The stream closes once the "
+        "job is done or failed. Served as a stream by the ASGI events "
+        "service; elsewhere only the current state is sent and the client "
+        "reconnects."
+    ),
+    "tags": ["jobs"],
+    "parameters": [
+        {
+            "in": "path",
+            "name": "event_id",
+            "schema": {"type": "string", "format": "uuid"},
+            "description": "Unique identifier for the job",
+            "required": True,
+        }
+    ],
+    "responses": {
+        "200": {
+            "content": {"text/event-stream": {"schema": {"type": "string"}}},
+            "description": "Server-Sent Events stream of job states",
+        },
+        "404": {
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            "error": {"type": "string", "description": "Error message"}
+                        },
+                    }
+                }
+            },
+            "description": "Job not found",
+        },
+    },
+}
+
+
+def add_job_events_path(
+    result: Dict[str, Any], generator: Any, request: Any, public: bool
+) -> Dict[str, Any]:
+    """
+    Add the job events endpoint to the generated schema.
+
+    JobEventsView is an async Django view rather than a DRF view, so
+    drf-spectacular doesn't discover it; this postprocessing hook
+    documents it by hand.
+
+    Args:
+        result: The generated OpenAPI document
+        generator: The schema generator
+        request: The request the schema is generated for, if any
+        public: Whether the schema is generated for public use
+
+    Returns:
+        The OpenAPI document with the events path added
+    """
+    result["paths"]["/jobs/{event_id}/events/"] = {"get": _JOB_EVENTS_OPERATION}
+    return result
@@ -1,22 +1,149 @@
-from rest_framework import serializers
+from collections.abc import Mapping
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+from django.core.validators import ProhibitNullCharactersValidator
+from rest_framework.fields import CharField, Field
+from rest_framework.serializers import ListSerializer, Serializer
+from rest_framework.validators import ProhibitSurrogateCharactersValidator
 
-class JobCreateSerializer(serializers.Serializer):
+TITLE_MAX_LENGTH = 255
+# Upper bound on the number of jobs a single bulk request may create
+MAX_BULK_JOBS = 100
+
+FieldErrors = Dict[str, List[str]]
+
+
+def _error(messages: Dict[str, Any], key: str, **kwargs: Any) -> str:
+    """
+    Render one of DRF's (translatable) validation messages.
+
+    Reusing DRF's messages keeps the API's error payloads identical to the
+    serializer-based validation this module replaces.
+    """
+    return str(messages[key]).format(**kwargs)
+
+
+def _clean_text(
+    value: Any, max_length: Optional[int] = None
+) -> Tuple[Optional[str], List[str]]:
     """
-    Serializer for creating a new guideline processing job.
+    Coerce, trim and validate a text value the way DRF's CharField does.
+
+    Besides the optional length limit, this applies the two validators DRF
+    adds to every CharField, rejecting null characters (which Postgres
+    can't store in text) and lone surrogates (which can't be encoded).
+
+    Args:
+        value: The raw input value
+        max_length: The maximum length of the trimmed value, if any
+
+    Returns:
+        A (value, errors) tuple; value is None when errors is not empty
+    """
+    if value is None:
+        return None, [_error(Field.default_error_messages, "null")]
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        return None, [_error(CharField.default_error_messages, "invalid")]
+
+    value = str(value).strip()
+    errors = []
+    if max_length is not None and len(value) > max_length:
+        errors.append(
+            _error(
+                CharField.default_error_messages, "max_length", max_length=max_length
+            )
+        )
+    if "\x00" in value:
+        errors.append(str(ProhibitNullCharactersValidator.message))
+    surrogate = next((ch for ch in value if 0xD800 <= ord(ch) <= 0xDFFF), None)
+    if surrogate is not None:
+        errors.append(
+            str(ProhibitSurrogateCharactersValidator.message).format(
+                code_point=ord(surrogate)
+            )
+        )
+    if errors:
+        return None, errors
+    return value, []
+
+
+def validate_job_data(data: Any) -> Tuple[Dict[str, str], FieldErrors]:
+    """
+    Validate the input data for creating a new guideline processing job.
+
+    A hand-rolled equivalent of a two-field DRF serializer (an optional title
+    of at most 255 characters and a required, non-blank guideline_text),
+    which avoids DRF's field binding and validation machinery on the job
+    creation hot path.
+
+    Args:
+        data: The parsed request body
+
+    Returns:
+        A (validated_data, errors) tuple; errors is empty when the data is
+        valid and otherwise maps field names to lists of DRF-style messages
+    """
+    if not isinstance(data, Mapping):
+        message = _error(
+            Serializer.default_error_messages,
+            "invalid",
+            datatype=type(data).__name__,
+        )
+        return {}, {"non_field_errors": [message]}
+
+    validated: Dict[str, str] = {}
+    errors: FieldErrors = {}
+
+    if "title" in data:
+        title, field_errors = _clean_text(data["title"], TITLE_MAX_LENGTH)
+        if field_errors:
+            errors["title"] = field_errors
+        else:
+            validated["title"] = title
+
+    if "guideline_text" not in data:
+        errors["guideline_text"] = [_error(Field.default_error_messages, "required")]
+    else:
+        guideline_text, field_errors = _clean_text(data["guideline_text"])
+        if not field_errors and not guideline_text:
+            field_errors = [_error(CharField.default_error_messages, "blank")]
+        if field_errors:
+            errors["guideline_text"] = field_errors
+        else:
+            validated["guideline_text"] = guideline_text
+
+    return validated, errors
+
+
+def validate_job_list(
+    data: List[Any],
+) -> Tuple[List[Dict[str, str]], Union[FieldErrors, List[FieldErrors]]]:
+    """
+    Validate a list of job inputs for bulk job creation.
+
+    Mirrors a DRF ListSerializer: the list itself must be non-empty and at
+    most MAX_BULK_JOBS long, and each item is validated by validate_job_data.
+
+    Args:
+        data: The parsed request body
 
-    Validates the input data for job creation, ensuring required fields
-    are present and properly formatted.
+    Returns:
+        A (validated_items, errors) tuple; errors is empty when every item is
+        valid, a non_field_errors dict when the list itself is rejected, and
+        otherwise a list with one (possibly empty) error dict per item
     """
+    if not data:
+        message = _error(ListSerializer.default_error_messages, "empty")
+        return [], {"non_field_errors": [message]}
+    if len(data) > MAX_BULK_JOBS:
+        message = _error(
+            ListSerializer.default_error_messages,
+            "max_length",
+            max_length=MAX_BULK_JOBS,
+        )
+        return [], {"non_field_errors": [message]}
 
-    title: serializers.CharField = serializers.CharField(
-        max_length=255,
-        required=False,
-        allow_blank=True,
-        help_text="Optional title for the guideline",
-    )
-    guideline_text: serializers.CharField = serializers.CharField(
-        required=True,
-        allow_blank=False,
-        help_text="The clinical guideline text to process",
-    )
+    results = [validate_job_data(item) for item in data]
+    if any(errors for _, errors in results):
+        return [], [errors for _, errors in results]
+    return [validated for validated, _ in results], []
@@ -1,130 +1,305 @@
+import hashlib
+import json
 import logging
 import os
-import time
+import re
 import uuid
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Tuple
 
+import httpx
 import openai
 from celery import shared_task
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
 
+from .caching import cache_get, cache_set
+from .events import publish_status
 from .models import Job
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
-# Initialize OpenAI client with new API
-api_key = os.getenv("OPENAI_API_KEY")
-if not api_key:
-    raise ValueError("OPENAI_API_KEY environment variable is required")
 
-client = openai.OpenAI(api_key=api_key)
+class JobLocked(Exception):
+    """Raised when a queued job's row is locked by another transaction."""
 
 
-@shared_task(bind=True, max_retries=5, default_retry_delay=2)
-def process_guideline(self, event_id: str) -> str:
+@lru_cache(maxsize=None)
+def get_client() -> openai.OpenAI:
     """
-    Process a guideline through a two-step GPT chain.
+    Return the process-wide OpenAI client, creating it on first use.
 
-    This Celery task performs the following steps:
-    1. Summarize the guideline text using GPT-4
-    2. Generate a checklist from the summary using GPT-4
-    3. Save results to the database
+    Building the client lazily keeps imports (management commands, test
+    collection) cheap and gives each forked worker process its own
+    connection pool. The pool speaks HTTP/2 and keeps connections alive, so
+    successive completions reuse one TLS session instead of handshaking
+    again.
+
+    Returns:
+        The shared OpenAI client
+
+    Raises:
+        ValueError: If OPENAI_API_KEY is not set
+    """
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("OPENAI_API_KEY environment variable is required")
+
+    http_client = openai.DefaultHttpxClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+        timeout=60,
+    )
+    return openai.OpenAI(api_key=api_key, http_client=http_client)
+
+
+# One checklist item per line, without leading bullets ("-", "•", "*") or
+# surrounding whitespace; blank and bullet-only lines are skipped
+CHECKLIST_LINE_RE = re.compile(r"^[\s\-•*]*([^\s\-•*].*?)\s*$", re.MULTILINE)
+
+
+# Identical guideline text is often resubmitted; reuse its GPT results
+GUIDELINE_CACHE_TIMEOUT = 30 * 24 * 60 * 60
+# Part of every guideline cache key; bump it whenever a prompt or model
+# changes so results from the old chain stop being served
+GUIDELINE_CACHE_VERSION = 1
+
+
+def _guideline_cache_key(guideline_text: str) -> str:
+    """
+    Build the cache key for a guideline's summary and checklist.
+
+    The key includes GUIDELINE_CACHE_VERSION and the chain in use, so the
+    combined and two-step chains never share results.
 
     Args:
-        event_id: The unique identifier of the job to process
+        guideline_text: The clinical guideline text
+
+    Returns:
+        A key derived from a 128-bit BLAKE2b digest of the text
+    """
+    chain = "combined" if settings.OPENAI_COMBINED_CHAIN else "two-step"
+    digest = hashlib.blake2b(guideline_text.encode(), digest_size=16).hexdigest()
+    return f"gl:v{GUIDELINE_CACHE_VERSION}:{chain}:{digest}"
+
+
+def _complete(**kwargs) -> str:
+    """
+    Run a streamed chat completion and return the full message text.
+
+    Args:
+        **kwargs: Arguments for chat.completions.create
+
+    Returns:
+        The concatenated content of every streamed chunk
+    """
+    stream = get_client().chat.completions.create(stream=True, **kwargs)
+    parts: List[str] = []
+    for chunk in stream:
+        if chunk.choices:
+            parts.append(chunk.choices[0].delta.content or "")
+    return "".join(parts)
+
+
+COMBINED_CHAIN_PROMPT = (
+    "Summarize the following clinical guideline, then convert the summary into "
+    "an action checklist. Return JSON with keys summary (string) and checklist "
+    "(array of short imperative steps, without bullets or numbering).\n\n"
+)
+
+
+def _run_combined_chain(guideline_text: str) -> Tuple[str, List[str]]:
+    """
+    Generate the summary and checklist with a single JSON-mode completion.
+
+    Args:
+        guideline_text: The clinical guideline text to process
+
+    Returns:
+        A (summary, checklist) tuple
+
+    Raises:
+        ValueError: If the model response is missing or mistypes a key
+    """
+    content = _complete(
+        # JSON mode is not available on the base gpt-4 model
+        model="gpt-4-turbo",
+        response_format={"type": "json_object"},
+        messages=[
+            {
+                "role": "system",
+                "content": "You are a medical assistant who summarizes clinical guidelines and converts them into action checklists.",
+            },
+            {
+                "role": "user",
+                "content": f"{COMBINED_CHAIN_PROMPT}{guideline_text}",
+            },
+        ],
+    )
+    result = json.loads(content)
+
+    summary = result.get("summary")
+    checklist = result.get("checklist")
+    if not isinstance(summary, str) or not isinstance(checklist, list):
+        raise ValueError("Model response is missing summary or checklist")
+
+    return summary.strip(), [str(step).strip() for step in checklist]
+
+
+def _run_two_step_chain(guideline_text: str) -> Tuple[str, List[str]]:
+    """
+    Generate the summary and checklist with two sequential completions.
+
+    Args:
+        guideline_text: The clinical guideline text to process
 
     Returns:
-        A success message string
+        A (summary, checklist) tuple
+    """
+    # Step 1: Summarize
+    summary = _complete(
+        model="gpt-4",
+        messages=[
+            {
+                "role": "system",
+                "content": "You are a medical summarization assistant.",
+            },
+            {
+                "role": "user",
+                "content": f"Summarize the following clinical guideline:\n\n{guideline_text}",
+            },
+        ],
+    ).strip()
+
+    # Step 2: Generate checklist
+    checklist_text = _complete(
+        model="gpt-4",
+        messages=[
+            {
+                "role": "system",
+                "content": "You are a medical assistant who converts summaries into action checklists.",
+            },
+            {
+                "role": "user",
+                "content": f"Create a clear checklist from this summary:\n\n{summary}",
+            },
+        ],
+    )
+    checklist: List[str] = CHECKLIST_LINE_RE.findall(checklist_text)
+
+    return summary, checklist
+
+
+@shared_task(
+    bind=True,
+    # The job is dispatched on commit, but retry in case the row isn't
+    # visible yet, or if another transaction had the queued row locked.
+    # Backoff is exponential (2s up to 32s) with full jitter so redelivered
+    # messages don't all retry at once.
+    autoretry_for=(Job.DoesNotExist, JobLocked),
+    retry_backoff=2,
+    retry_backoff_max=32,
+    retry_jitter=True,
+    max_retries=5,
+    ignore_result=True,
+)
+def process_guideline(self, event_id: uuid.UUID) -> None:
+    """
+    Process a guideline through the GPT summary and checklist chain.
+
+    This Celery task performs the following steps:
+    1. Summarize the guideline text and generate a checklist using GPT-4,
+       in one JSON-mode request (or two requests when
+       OPENAI_COMBINED_CHAIN is disabled); results for previously seen
+       guideline text are reused from the cache
+    2. Save results to the database
+
+    Results live on the Job row; the Celery task result is not stored.
+
+    Args:
+        event_id: The unique identifier of the job to process
 
     Raises:
         Job.DoesNotExist: If the job doesn't exist after retries
+        JobLocked: If the queued job is still locked after retries
         Exception: For any other processing errors
     """
-    try:
-        event_uuid = uuid.UUID(event_id)
-        job = Job.objects.get(event_id=event_uuid)
-    except Job.DoesNotExist:
-        # Exponential backoff: 2s, 4s, 8s, 16s, 32s
-        retry_delay = 2 ** (self.request.retries + 1)
-        if self.request.retries < self.max_retries:
-            logger.warning(
-                f"Job {event_id} not found, retrying in {retry_delay}s (attempt {self.request.retries + 1}/{self.max_retries})"
+    # Claim the job with a single conditional UPDATE so that a redelivered
+    # message can't send the same job to OpenAI twice. The row is selected
+    # with FOR UPDATE SKIP LOCKED, so a duplicate delivery skips a row another
+    # worker is claiming instead of waiting on its lock (SQLite ignores this).
+    # update() writes only the named columns and skips auto_now, so updated_at
+    # is set explicitly.
+    with transaction.atomic():
+        queued = Job.objects.select_for_update(skip_locked=True).filter(
+            event_id=event_id, status="queued"
+        )
+        claimed = Job.objects.filter(pk__in=queued.values("pk")).update(
+            status="processing", updated_at=timezone.now()
+        )
+    if not claimed:
+        try:
+            job_status = Job.objects.values_list("status", flat=True).get(
+                event_id=event_id
             )
-            raise self.retry(
-                exc=Job.DoesNotExist("Job not ready yet."), countdown=retry_delay
+        except Job.DoesNotExist:
+            logger.warning(
+                f"Job {event_id} not found (attempt {self.request.retries + 1}/{self.max_retries + 1})"
             )
-        else:
-            # If we've exhausted retries, mark the job as failed
-            try:
-                job = Job.objects.get(event_id=event_uuid)
-            except Job.DoesNotExist:
-                # Job truly doesn't exist, can't mark as failed
-                logger.error(f"Job {event_id} not found after max retries")
-                raise
-            job.status = "failed"
-            job.save()
-            logger.error(f"Job {event_id} marked as failed after max retries")
             raise
 
-    # Check if job is already being processed or completed
-    if job.status in ["processing", "done", "failed"]:
-        logger.info(f"Job {event_id} already processed with status: {job.status}")
-        return f"Job {event_id} already processed with status: {job.status}"
+        if job_status == "queued":
+            # SKIP LOCKED passed over the row because something else (such as
+            # an admin save) holds its lock, so nobody has claimed the job
+            raise JobLocked(f"Job {event_id} is locked by another transaction")
 
-    job.status = "processing"
-    job.save()
+        logger.info(f"Job {event_id} already processed with status: {job_status}")
+        return
+
+    job = Job.objects.only("guideline_text").get(event_id=event_id)
     logger.info(f"Started processing job {event_id}")
+    publish_status(event_id, "processing")
+
+    # Hand the connection back to the pool instead of holding it for the
+    # whole OpenAI call; the final status update checks one out again
+    if not connection.in_atomic_block:
+        connection.close()
 
     try:
-        # Step 1: Summarize
-        logger.info(f"Generating summary for job {event_id}")
-        summary_response = client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a medical summarization assistant.",
-                },
-                {
-                    "role": "user",
-                    "content": f"Summarize the following clinical guideline:\n\n{job.guideline_text}",
-                },
-            ],
-        )
-        summary = summary_response.choices[0].message.content.strip()
-
-        # Step 2: Generate checklist
-        logger.info(f"Generating checklist for job {event_id}")
-        checklist_response = client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a medical assistant who converts summaries into action checklists.",
-                },
-                {
-                    "role": "user",
-                    "content": f"Create a clear checklist from this summary:\n\n{summary}",
-                },
-            ],
+        cache_key = _guideline_cache_key(job.guideline_text)
+        cached = cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached summary and checklist for job {event_id}")
+            summary, checklist = cached["summary"], cached["checklist"]
+        else:
+            if settings.OPENAI_COMBINED_CHAIN:
+                logger.info(f"Generating summary and checklist for job {event_id}")
+                summary, checklist = _run_combined_chain(job.guideline_text)
+            else:
+                logger.info(
+                    f"Generating summary and checklist for job {event_id} in two steps"
+                )
+                summary, checklist = _run_two_step_chain(job.guideline_text)
+            cache_set(
+                cache_key,
+                {"summary": summary, "checklist": checklist},
+                timeout=GUIDELINE_CACHE_TIMEOUT,
+            )
+
+        Job.objects.filter(pk=job.pk).update(
+            status="done",
+            summary=summary,
+            checklist=checklist,
+            updated_at=timezone.now(),
         )
-        checklist_text = checklist_response.choices[0].message.content.strip()
-        checklist: List[str] = [
-            line.lstrip("-•* ").strip()
-            for line in checklist_text.split("\n")
-            if line.strip()
-        ]
-
-        job.summary = summary
-        job.checklist = checklist
-        job.status = "done"
-        job.save()
+        publish_status(event_id, "done", summary, checklist)
 
         logger.info(f"Successfully completed job {event_id}")
-        return f"Successfully processed job {event_id}"
 
     except Exception as e:
         logger.error(f"Error processing job {event_id}: {str(e)}")
-        job.status = "failed"
-        job.save()
+        Job.objects.filter(pk=job.pk).update(status="failed", updated_at=timezone.now())
+        publish_status(event_id, "failed")
         raise
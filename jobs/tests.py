@@ -1,16 +1,32 @@
 import json
 import uuid
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+import redis
 
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.test import Client, TestCase
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
 
+from .events import channel_name, publish_status
 from .models import Job
-from .tasks import process_guideline
+from .tasks import JobLocked, get_client, process_guideline
+
+
+def stream_completion(content):
+    """Build a mocked streamed chat completion that yields content in two chunks"""
+    chunks = []
+    for part in (content[: len(content) // 2], content[len(content) // 2 :]):
+        chunk = MagicMock()
+        chunk.choices[0].delta.content = part
+        chunks.append(chunk)
+    return chunks
 
 
 class JobModelTest(TestCase):
@@ -85,6 +101,7 @@ class JobCreateViewTest(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
         self.assertIn("event_id", response.data)
+        self.assertIsInstance(response.data["event_id"], str)
 
         # Verify job was created in database
         job = Job.objects.get(event_id=response.data["event_id"])
@@ -95,6 +112,90 @@ class JobCreateViewTest(APITestCase):
         )
         self.assertEqual(job.status, "queued")
 
+    @patch("jobs.views.process_guideline")
+    def test_create_job_dispatches_after_commit(self, mock_task):
+        """Test that the task is only queued once the job row is committed"""
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            response = self.client.post(self.url, self.valid_data, format="json")
+            mock_task.apply_async.assert_not_called()
+
+        self.assertEqual(len(callbacks), 1)
+        job = Job.objects.get(event_id=response.data["event_id"])
+        mock_task.apply_async.assert_called_once_with((job.event_id,), retry=False)
+
+    @patch("jobs.views.process_guideline")
+    def test_create_job_survives_broker_failure(self, mock_task):
+        """Test that a failed publish doesn't fail the create request"""
+        mock_task.apply_async.side_effect = ConnectionError("broker down")
+
+        with self.assertLogs("django.test", level="ERROR"):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(self.url, self.valid_data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertTrue(
+            Job.objects.filter(event_id=response.data["event_id"]).exists()
+        )
+
+    @patch("jobs.views.group")
+    @patch("jobs.views.process_guideline")
+    def test_create_jobs_bulk(self, mock_task, mock_group):
+        """Test that a list body creates one job per item in a single INSERT"""
+        items = [
+            self.valid_data,
+            {"guideline_text": "Adults should have blood pressure checked yearly."},
+        ]
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(self.url, items, format="json")
+            mock_group.return_value.apply_async.assert_not_called()
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(len(response.data["event_ids"]), 2)
+        inserts = [q for q in queries if q["sql"].startswith("INSERT")]
+        self.assertEqual(len(inserts), 1)
+
+        jobs = [Job.objects.get(event_id=e) for e in response.data["event_ids"]]
+        self.assertEqual(jobs[0].title, "Test Guideline")
+        self.assertEqual(jobs[1].title, "Untitled Guideline")
+        self.assertTrue(all(job.status == "queued" for job in jobs))
+
+        # All jobs are queued through a single group once the INSERT commits
+        self.assertEqual(len(callbacks), 1)
+        mock_group.return_value.apply_async.assert_called_once_with(retry=False)
+        self.assertEqual(
+            [c.args for c in mock_task.s.call_args_list],
+            [(job.event_id,) for job in jobs],
+        )
+
+    def test_create_jobs_bulk_invalid_item(self):
+        """Test that one invalid item rejects the whole list"""
+        items = [self.valid_data, {"title": "Missing text"}]
+        response = self.client.post(self.url, items, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data, [{}, {"guideline_text": ["This field is required."]}]
+        )
+        self.assertEqual(Job.objects.count(), 0)
+
+    def test_create_jobs_bulk_empty_list(self):
+        """Test that an empty list is rejected"""
+        response = self.client.post(self.url, [], format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["non_field_errors"], ["This list may not be empty."]
+        )
+
+    def test_create_jobs_bulk_too_many(self):
+        """Test that lists over the bulk limit are rejected"""
+        response = self.client.post(self.url, [self.valid_data] * 101, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("non_field_errors", response.data)
+        self.assertEqual(Job.objects.count(), 0)
+
     def test_create_job_missing_guideline_text(self):
         """Test job creation with missing guideline_text"""
         invalid_data = {"title": "Test Guideline"}
@@ -115,6 +216,79 @@ class JobCreateViewTest(APITestCase):
             response.data["guideline_text"][0], "This field may not be blank."
         )
 
+    def test_create_job_whitespace_guideline_text(self):
+        """Test that whitespace-only guideline_text is rejected as blank"""
+        invalid_data = {"title": "Test Guideline", "guideline_text": "  \n "}
+        response = self.client.post(self.url, invalid_data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["guideline_text"][0], "This field may not be blank."
+        )
+
+    def test_create_job_invalid_field_types(self):
+        """Test job creation with null guideline_text and non-string title"""
+        invalid_data = {"title": ["Test"], "guideline_text": None}
+        response = self.client.post(self.url, invalid_data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["title"], ["Not a valid string."])
+        self.assertEqual(
+            response.data["guideline_text"], ["This field may not be null."]
+        )
+
+    def test_create_job_null_characters(self):
+        """Test that null characters are rejected in either field"""
+        invalid_data = {"title": "Test\x00", "guideline_text": "a\x00b"}
+        response = self.client.post(self.url, invalid_data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["title"], ["Null characters are not allowed."])
+        self.assertEqual(
+            response.data["guideline_text"], ["Null characters are not allowed."]
+        )
+        self.assertEqual(Job.objects.count(), 0)
+
+    def test_create_job_surrogate_characters(self):
+        """Test that lone surrogates are rejected, including in bulk items"""
+        # Sent as raw JSON, since a lone surrogate can't be encoded as UTF-8
+        response = self.client.post(
+            self.url,
+            '[{"guideline_text": "ok"}, {"guideline_text": "a\\ud800b"}]',
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data,
+            [
+                {},
+                {"guideline_text": ["Surrogate characters are not allowed: U+D800."]},
+            ],
+        )
+        self.assertEqual(Job.objects.count(), 0)
+
+    def test_create_job_title_too_long(self):
+        """Test job creation with a title over 255 characters"""
+        invalid_data = {"title": "A" * 256, "guideline_text": "Test guideline text"}
+        response = self.client.post(self.url, invalid_data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["title"],
+            ["Ensure this field has no more than 255 characters."],
+        )
+
+    def test_create_job_strips_whitespace(self):
+        """Test that title and guideline_text are trimmed"""
+        data = {"title": "  Test Guideline ", "guideline_text": " Test text\n"}
+        response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        job = Job.objects.get(event_id=response.data["event_id"])
+        self.assertEqual(job.title, "Test Guideline")
+        self.assertEqual(job.guideline_text, "Test text")
+
     def test_create_job_without_title(self):
         """Test job creation without title (should use default)"""
         data = {"guideline_text": "Test guideline text"}
@@ -137,6 +311,7 @@ class JobDetailViewTest(APITestCase):
     """Test cases for JobDetailView"""
 
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.job = Job.objects.create(
             title="Test Guideline",
@@ -157,6 +332,54 @@ class JobDetailViewTest(APITestCase):
         self.assertEqual(response.data["summary"], "Test summary")
         self.assertEqual(response.data["checklist"], ["Step 1", "Step 2"])
 
+    def test_get_job_detail_skips_guideline_text(self):
+        """Test that polling does not load the guideline text"""
+        url = reverse("job-detail", kwargs={"event_id": self.job.event_id})
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn("guideline_text", queries[0]["sql"])
+
+    def test_get_job_detail_caches_terminal_status(self):
+        """Test that finished jobs are served from the cache on later polls"""
+        url = reverse("job-detail", kwargs={"event_id": self.job.event_id})
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["summary"], "Test summary")
+        self.assertEqual(response.data["checklist"], ["Step 1", "Step 2"])
+
+    @patch("jobs.caching.cache")
+    def test_get_job_detail_cache_unavailable(self, mock_cache):
+        """Test that a cache outage falls back to the database"""
+        mock_cache.get.side_effect = ConnectionError("cache down")
+        mock_cache.set.side_effect = ConnectionError("cache down")
+        url = reverse("job-detail", kwargs={"event_id": self.job.event_id})
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["summary"], "Test summary")
+
+    def test_get_job_detail_does_not_cache_pending_status(self):
+        """Test that queued jobs are read from the database on every poll"""
+        job = Job.objects.create(
+            title="Pending", guideline_text="Pending text", status="queued"
+        )
+        url = reverse("job-detail", kwargs={"event_id": job.event_id})
+        self.client.get(url)
+        Job.objects.filter(pk=job.pk).update(status="processing")
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.data["status"], "processing")
+
     def test_get_job_detail_not_found(self):
         """Test job detail retrieval for non-existent job"""
         fake_event_id = uuid.uuid4()
@@ -168,49 +391,308 @@ class JobDetailViewTest(APITestCase):
         self.assertEqual(response.data["error"], "Job not found")
 
 
+class JobEventsViewTest(TestCase):
+    """Test cases for JobEventsView"""
+
+    def setUp(self):
+        self.job = Job.objects.create(
+            title="Test Guideline",
+            guideline_text="Test guideline text",
+            status="queued",
+        )
+        self.url = reverse("job-events", kwargs={"event_id": self.job.event_id})
+
+    async def read_events(self, response):
+        """Return the data payloads of a streamed response, in order"""
+        if response.is_async:
+            chunks = [chunk async for chunk in response.streaming_content]
+        else:
+            chunks = list(response.streaming_content)
+        body = b"".join(chunks).decode()
+        return [
+            json.loads(line[len("data: ") :])
+            for line in body.splitlines()
+            if line.startswith("data: ")
+        ]
+
+    def mock_pubsub(self, *messages):
+        """Build a subscription that delivers the given messages"""
+        pubsub = MagicMock()
+        pubsub.get_message = AsyncMock(side_effect=list(messages))
+        return pubsub
+
+    @patch("jobs.views.close_subscription", new_callable=AsyncMock)
+    @patch("jobs.views.subscribe", new_callable=AsyncMock)
+    async def test_events_relays_status_changes(self, mock_subscribe, mock_close):
+        """Test that published status changes are streamed until the job ends"""
+        event_id = str(self.job.event_id)
+        pubsub = self.mock_pubsub(
+            None,
+            {"data": json.dumps({"event_id": event_id, "status": "processing"})},
+            {"data": json.dumps({"event_id": event_id, "status": "done"})},
+        )
+        mock_subscribe.return_value = pubsub
+
+        response = await self.async_client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        events = await self.read_events(response)
+        self.assertEqual(
+            [event["status"] for event in events], ["queued", "processing", "done"]
+        )
+        self.assertEqual(events[0]["event_id"], event_id)
+        self.assertEqual(pubsub.get_message.await_count, 3)
+        mock_close.assert_awaited_once_with(pubsub)
+
+    @patch("jobs.views.close_subscription", new_callable=AsyncMock)
+    @patch("jobs.views.subscribe", new_callable=AsyncMock)
+    async def test_events_terminal_job_closes_immediately(
+        self, mock_subscribe, mock_close
+    ):
+        """Test that a finished job's stream sends its state and ends"""
+        await Job.objects.filter(pk=self.job.pk).aupdate(
+            status="done", summary="Test summary", checklist=["Step 1"]
+        )
+        pubsub = self.mock_pubsub()
+        mock_subscribe.return_value = pubsub
+
+        response = await self.async_client.get(self.url)
+
+        events = await self.read_events(response)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["summary"], "Test summary")
+        self.assertEqual(events[0]["checklist"], ["Step 1"])
+        pubsub.get_message.assert_not_awaited()
+        mock_close.assert_awaited_once_with(pubsub)
+
+    async def test_events_disabled_sends_current_state(self):
+        """Test that without pub/sub the stream sends the current state only"""
+        response = await self.async_client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        events = await self.read_events(response)
+        self.assertEqual([event["status"] for event in events], ["queued"])
+
+    @patch("jobs.views.subscribe", new_callable=AsyncMock)
+    def test_events_under_wsgi_sends_current_state(self, mock_subscribe):
+        """Test that WSGI requests aren't held open waiting for changes"""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = b"".join(response.streaming_content).decode()
+        self.assertIn('"status": "queued"', body)
+        mock_subscribe.assert_not_awaited()
+
+    @patch("jobs.views.close_subscription", new_callable=AsyncMock)
+    @patch("jobs.views.subscribe", new_callable=AsyncMock)
+    async def test_events_not_found(self, mock_subscribe, mock_close):
+        """Test streaming events for a job that doesn't exist"""
+        url = reverse("job-events", kwargs={"event_id": uuid.uuid4()})
+        response = await self.async_client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(json.loads(response.content), {"error": "Job not found"})
+        mock_close.assert_awaited_once_with(mock_subscribe.return_value)
+
+
+class PublishStatusTest(TestCase):
+    """Test cases for job status publishing"""
+
+    @override_settings(JOB_EVENTS_ENABLED=True)
+    @patch("jobs.events.get_redis")
+    def test_publish_status(self, mock_get_redis):
+        """Test that status changes are published to the job's channel"""
+        event_id = uuid.uuid4()
+        publish_status(event_id, "done", "Test summary", ["Step 1"])
+
+        channel, data = mock_get_redis.return_value.publish.call_args.args
+        self.assertEqual(channel, channel_name(event_id))
+        self.assertEqual(
+            json.loads(data),
+            {
+                "event_id": str(event_id),
+                "status": "done",
+                "summary": "Test summary",
+                "checklist": ["Step 1"],
+            },
+        )
+
+    @override_settings(JOB_EVENTS_ENABLED=True)
+    @patch("jobs.events.get_redis")
+    def test_publish_status_redis_error(self, mock_get_redis):
+        """Test that a Redis failure doesn't propagate to the caller"""
+        mock_get_redis.return_value.publish.side_effect = redis.ConnectionError()
+
+        publish_status(uuid.uuid4(), "processing")
+
+    @patch("jobs.events.get_redis")
+    def test_publish_status_disabled(self, mock_get_redis):
+        """Test that nothing is published when job events are disabled"""
+        publish_status(uuid.uuid4(), "processing")
+
+        mock_get_redis.assert_not_called()
+
+
 class ProcessGuidelineTaskTest(TestCase):
     """Test cases for the process_guideline Celery task"""
 
     def setUp(self):
+        cache.clear()
         self.job = Job.objects.create(
             title="Test Guideline",
             guideline_text="Test guideline text for diabetes management.",
             status="queued",
         )
-        self.event_id = str(self.job.event_id)
+        self.event_id = self.job.event_id
+
+    @patch("jobs.tasks.get_client")
+    def test_process_guideline_combined_chain(self, mock_get_client):
+        """Test that the combined chain makes a single JSON-mode request"""
+        mock_client = mock_get_client.return_value
+        mock_response = stream_completion(
+            json.dumps({"summary": "Test summary", "checklist": ["Step 1", "Step 2"]})
+        )
+        mock_client.chat.completions.create.return_value = mock_response
+
+        process_guideline(self.event_id)
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, "done")
+        self.assertEqual(self.job.summary, "Test summary")
+        self.assertEqual(self.job.checklist, ["Step 1", "Step 2"])
+
+        mock_client.chat.completions.create.assert_called_once()
+        _, kwargs = mock_client.chat.completions.create.call_args
+        self.assertEqual(kwargs["response_format"], {"type": "json_object"})
+        self.assertTrue(kwargs["stream"])
+
+    @patch("jobs.tasks.get_client")
+    def test_process_guideline_combined_chain_invalid_response(self, mock_get_client):
+        """Test that a response missing the checklist marks the job as failed"""
+        mock_client = mock_get_client.return_value
+        mock_response = stream_completion(json.dumps({"summary": "Test summary"}))
+        mock_client.chat.completions.create.return_value = mock_response
+
+        with self.assertRaises(ValueError):
+            process_guideline(self.event_id)
 
-    @patch("jobs.tasks.client")
-    def test_process_guideline_success(self, mock_client):
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, "failed")
+
+    @override_settings(OPENAI_COMBINED_CHAIN=False)
+    @patch("jobs.tasks.get_client")
+    def test_process_guideline_success(self, mock_get_client):
         """Test successful guideline processing"""
+        mock_client = mock_get_client.return_value
         # Mock OpenAI responses
-        mock_summary_response = MagicMock()
-        mock_summary_response.choices[0].message.content = "Test summary"
+        mock_summary_response = stream_completion("Test summary")
         mock_client.chat.completions.create.return_value = mock_summary_response
 
         # Mock checklist response
-        mock_checklist_response = MagicMock()
-        mock_checklist_response.choices[0].message.content = (
-            "- Step 1\n- Step 2\n- Step 3"
-        )
+        mock_checklist_response = stream_completion("- Step 1\n- Step 2\n- Step 3")
         mock_client.chat.completions.create.side_effect = [
             mock_summary_response,
             mock_checklist_response,
         ]
 
-        result = process_guideline(self.event_id)
+        process_guideline(self.event_id)
 
         # Verify job was updated
         self.job.refresh_from_db()
         self.assertEqual(self.job.status, "done")
         self.assertEqual(self.job.summary, "Test summary")
         self.assertEqual(self.job.checklist, ["Step 1", "Step 2", "Step 3"])
-        self.assertEqual(result, f"Successfully processed job {self.event_id}")
 
         # Verify OpenAI was called twice
         self.assertEqual(mock_client.chat.completions.create.call_count, 2)
 
-    @patch("jobs.tasks.client")
-    def test_process_guideline_job_not_found_retry(self, mock_client):
+    @patch("jobs.tasks.get_client")
+    def test_process_guideline_reuses_cached_results(self, mock_get_client):
+        """Test that resubmitted guideline text skips the OpenAI calls"""
+        mock_client = mock_get_client.return_value
+        mock_client.chat.completions.create.return_value = stream_completion(
+            json.dumps({"summary": "Test summary", "checklist": ["Step 1"]})
+        )
+        process_guideline(self.event_id)
+
+        duplicate = Job.objects.create(
+            title="Resubmitted Guideline",
+            guideline_text=self.job.guideline_text,
+            status="queued",
+        )
+        process_guideline(str(duplicate.event_id))
+
+        duplicate.refresh_from_db()
+        self.assertEqual(duplicate.status, "done")
+        self.assertEqual(duplicate.summary, "Test summary")
+        self.assertEqual(duplicate.checklist, ["Step 1"])
+        mock_client.chat.completions.create.assert_called_once()
+
+    @patch("jobs.tasks.get_client")
+    def test_process_guideline_cache_keyed_by_chain(self, mock_get_client):
+        """Test that results from one chain aren't reused by the other"""
+        mock_client = mock_get_client.return_value
+        mock_client.chat.completions.create.side_effect = [
+            stream_completion(
+                json.dumps({"summary": "Combined summary", "checklist": ["Step 1"]})
+            ),
+            stream_completion("Two-step summary"),
+            stream_completion("- Step A"),
+        ]
+        process_guideline(self.event_id)
+
+        duplicate = Job.objects.create(
+            title="Resubmitted Guideline",
+            guideline_text=self.job.guideline_text,
+            status="queued",
+        )
+        with override_settings(OPENAI_COMBINED_CHAIN=False):
+            process_guideline(duplicate.event_id)
+
+        duplicate.refresh_from_db()
+        self.assertEqual(duplicate.summary, "Two-step summary")
+        self.assertEqual(duplicate.checklist, ["Step A"])
+        self.assertEqual(mock_client.chat.completions.create.call_count, 3)
+
+    @patch("jobs.caching.cache")
+    @patch("jobs.tasks.get_client")
+    def test_process_guideline_ignores_cache_errors(self, mock_get_client, mock_cache):
+        """Test that a cache outage doesn't fail the job or discard its results"""
+        mock_cache.get.side_effect = ConnectionError("cache down")
+        mock_cache.set.side_effect = ConnectionError("cache down")
+        mock_client = mock_get_client.return_value
+        mock_client.chat.completions.create.return_value = stream_completion(
+            json.dumps({"summary": "Test summary", "checklist": ["Step 1"]})
+        )
+
+        process_guideline(self.event_id)
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, "done")
+        self.assertEqual(self.job.summary, "Test summary")
+        mock_cache.set.assert_called_once()
+
+    @patch("jobs.tasks.get_client")
+    def test_process_guideline_updates_timestamp(self, mock_get_client):
+        """Test that status updates still bump updated_at"""
+        mock_client = mock_get_client.return_value
+        mock_response = stream_completion(
+            json.dumps({"summary": "Test summary", "checklist": ["Step 1"]})
+        )
+        mock_client.chat.completions.create.return_value = mock_response
+        previous_updated_at = self.job.updated_at
+
+        process_guideline(self.event_id)
+
+        self.job.refresh_from_db()
+        self.assertGreater(self.job.updated_at, previous_updated_at)
+        self.assertEqual(
+            self.job.guideline_text, "Test guideline text for diabetes management."
+        )
+
+    @patch("jobs.tasks.get_client")
+    def test_process_guideline_job_not_found_retry(self, mock_get_client):
         """Test task retry when job doesn't exist initially"""
         # Delete the job to simulate it not existing
         self.job.delete()
@@ -224,24 +706,96 @@ class ProcessGuidelineTaskTest(TestCase):
 
             # Verify retry was called
             mock_retry.assert_called_once()
+            _, kwargs = mock_retry.call_args
+            self.assertIsInstance(kwargs["exc"], Job.DoesNotExist)
+            self.assertLessEqual(kwargs["countdown"], 32)
+
+    @patch("jobs.tasks.get_client")
+    def test_process_guideline_locked_job_retry(self, mock_get_client):
+        """Test task retry when a queued job's row is locked elsewhere"""
+        mock_client = mock_get_client.return_value
+
+        # SKIP LOCKED returns no rows while another transaction holds the lock
+        with patch.object(
+            Job.objects, "select_for_update", return_value=Job.objects.none()
+        ), patch.object(process_guideline, "retry") as mock_retry:
+            mock_retry.side_effect = Exception("Retry called")
+
+            with self.assertRaises(Exception):
+                process_guideline(self.event_id)
+
+            mock_retry.assert_called_once()
+            _, kwargs = mock_retry.call_args
+            self.assertIsInstance(kwargs["exc"], JobLocked)
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, "queued")
+        mock_client.chat.completions.create.assert_not_called()
 
-    @patch("jobs.tasks.client")
-    def test_process_guideline_already_processed(self, mock_client):
+    @patch("jobs.tasks.get_client")
+    def test_process_guideline_already_processed(self, mock_get_client):
         """Test task when job is already processed"""
+        mock_client = mock_get_client.return_value
         self.job.status = "done"
         self.job.save()
 
-        result = process_guideline(self.event_id)
+        process_guideline(self.event_id)
 
-        self.assertEqual(
-            result, f"Job {self.event_id} already processed with status: done"
-        )
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, "done")
         # Verify OpenAI was not called
         mock_client.chat.completions.create.assert_not_called()
 
-    @patch("jobs.tasks.client")
-    def test_process_guideline_openai_error(self, mock_client):
+    @patch("jobs.tasks.get_client")
+    def test_process_guideline_duplicate_delivery(self, mock_get_client):
+        """Test that a job claimed by another worker is not processed again"""
+        mock_client = mock_get_client.return_value
+        self.job.status = "processing"
+        self.job.save()
+
+        process_guideline(self.event_id)
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, "processing")
+        mock_client.chat.completions.create.assert_not_called()
+
+    @patch("jobs.tasks.publish_status")
+    @patch("jobs.tasks.get_client")
+    def test_process_guideline_publishes_status_changes(
+        self, mock_get_client, mock_publish
+    ):
+        """Test that each status change is published for event subscribers"""
+        mock_client = mock_get_client.return_value
+        mock_client.chat.completions.create.return_value = stream_completion(
+            json.dumps({"summary": "Test summary", "checklist": ["Step 1"]})
+        )
+
+        process_guideline(self.event_id)
+
+        self.assertEqual(
+            mock_publish.call_args_list,
+            [
+                call(self.event_id, "processing"),
+                call(self.event_id, "done", "Test summary", ["Step 1"]),
+            ],
+        )
+
+    @patch("jobs.tasks.publish_status")
+    @patch("jobs.tasks.get_client")
+    def test_process_guideline_publishes_failure(self, mock_get_client, mock_publish):
+        """Test that a failed job is published for event subscribers"""
+        mock_client = mock_get_client.return_value
+        mock_client.chat.completions.create.side_effect = Exception("OpenAI API Error")
+
+        with self.assertRaises(Exception):
+            process_guideline(self.event_id)
+
+        mock_publish.assert_called_with(self.event_id, "failed")
+
+    @patch("jobs.tasks.get_client")
+    def test_process_guideline_openai_error(self, mock_get_client):
         """Test task failure when OpenAI API fails"""
+        mock_client = mock_get_client.return_value
         # Mock OpenAI to raise an exception
         mock_client.chat.completions.create.side_effect = Exception("OpenAI API Error")
 
@@ -252,15 +806,15 @@ class ProcessGuidelineTaskTest(TestCase):
         self.job.refresh_from_db()
         self.assertEqual(self.job.status, "failed")
 
-    @patch("jobs.tasks.client")
-    def test_process_guideline_checklist_parsing(self, mock_client):
+    @override_settings(OPENAI_COMBINED_CHAIN=False)
+    @patch("jobs.tasks.get_client")
+    def test_process_guideline_checklist_parsing(self, mock_get_client):
         """Test checklist parsing from OpenAI response"""
+        mock_client = mock_get_client.return_value
         # Mock responses
-        mock_summary_response = MagicMock()
-        mock_summary_response.choices[0].message.content = "Test summary"
+        mock_summary_response = stream_completion("Test summary")
 
-        mock_checklist_response = MagicMock()
-        mock_checklist_response.choices[0].message.content = (
+        mock_checklist_response = stream_completion(
             "• First step\n- Second step\n* Third step"
         )
 
@@ -269,13 +823,56 @@ class ProcessGuidelineTaskTest(TestCase):
             mock_checklist_response,
         ]
 
-        result = process_guideline(self.event_id)
+        process_guideline(self.event_id)
 
         # Verify checklist was parsed correctly
         self.job.refresh_from_db()
         expected_checklist = ["First step", "Second step", "Third step"]
         self.assertEqual(self.job.checklist, expected_checklist)
 
+    @override_settings(OPENAI_COMBINED_CHAIN=False)
+    @patch("jobs.tasks.get_client")
+    def test_process_guideline_checklist_parsing_blank_lines(self, mock_get_client):
+        """Test that blank, bullet-only and indented lines are handled"""
+        mock_client = mock_get_client.return_value
+        mock_summary_response = stream_completion("Test summary")
+
+        mock_checklist_response = stream_completion(
+            "\n  - First step  \r\n\n-\n\t• Second step\n"
+        )
+
+        mock_client.chat.completions.create.side_effect = [
+            mock_summary_response,
+            mock_checklist_response,
+        ]
+
+        process_guideline(self.event_id)
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.checklist, ["First step", "Second step"])
+
+
+class GetClientTest(TestCase):
+    """Test cases for the lazily built OpenAI client"""
+
+    def setUp(self):
+        get_client.cache_clear()
+        self.addCleanup(get_client.cache_clear)
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
+    def test_client_is_shared(self):
+        """Test that the client is built once per process"""
+        client = get_client()
+
+        self.assertIs(get_client(), client)
+        self.assertEqual(client.api_key, "test-key")
+
+    @patch.dict("os.environ", {}, clear=True)
+    def test_missing_api_key(self):
+        """Test that a missing OPENAI_API_KEY is reported on first use"""
+        with self.assertRaises(ValueError):
+            get_client()
+
 
 class JobIntegrationTest(APITestCase):
     """Integration tests for the complete job workflow"""
@@ -365,6 +962,37 @@ class JobModelValidationTest(TestCase):
         with self.assertRaises(ValidationError):
             job.full_clean()
 
+
+class JobAdminTest(TestCase):
+    """Test cases for the Job admin"""
+
+    def setUp(self):
+        self.user = User.objects.create_superuser("admin", "admin@example.com", "pw")
+        self.client.force_login(self.user)
+        self.job = Job.objects.create(
+            title="Admin Job", guideline_text="Long guideline text", summary="Sum"
+        )
+
+    def test_changelist_defers_large_columns(self):
+        """Test that the changelist does not load guideline_text"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("admin:jobs_job_changelist"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Admin Job")
+        job_queries = [q["sql"] for q in queries if 'FROM "jobs_job"' in q["sql"]]
+        self.assertTrue(job_queries)
+        for sql in job_queries:
+            self.assertNotIn("guideline_text", sql)
+
+    def test_change_form_loads_all_columns(self):
+        """Test that the change form still shows the full job"""
+        url = reverse("admin:jobs_job_change", args=[self.job.pk])
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Long guideline text")
+
 class JobAPITestCase(TestCase):
     def setUp(self):
         self.client = APIClient()
@@ -414,8 +1042,9 @@ class JobAPITestCase(TestCase):
         self.assertIsInstance(job.checklist, list)
         self.assertTrue(len(job.checklist) > 0)
 
-    @patch("jobs.tasks.client.chat.completions.create")
-    def test_openai_failure_sets_job_failed(self, mock_create):
+    @patch("jobs.tasks.get_client")
+    def test_openai_failure_sets_job_failed(self, mock_get_client):
+        mock_create = mock_get_client.return_value.chat.completions.create
         mock_create.side_effect = Exception("OpenAI failure")
         job = Job.objects.create(
             title="Should Fail",
@@ -1,10 +1,13 @@
 from django.urls import path
 
-from .views import JobCreateView, JobDetailView
+from .views import JobCreateView, JobDetailView, JobEventsView
 
 urlpatterns = [
     path("", JobCreateView.as_view(), name="create-job"),  # POST /jobs
     path(
         "<uuid:event_id>/", JobDetailView.as_view(), name="job-detail"
     ),  # GET /jobs/<event_id>
+    path(
+        "<uuid:event_id>/events/", JobEventsView.as_view(), name="job-events"
+    ),  # GET /jobs/<event_id>/events (Server-Sent Events)
 ]
@@ -1,93 +1,220 @@
-from typing import Any, Dict
+import json
+import time
+import uuid
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
-from django.db import transaction
+from asgiref.sync import sync_to_async
+from celery import group
+from django.core.handlers.asgi import ASGIRequest
+from django.db import connection, transaction
+from django.http import HttpRequest, JsonResponse, StreamingHttpResponse
+from django.views import View
 from drf_spectacular.utils import (OpenApiExample, OpenApiParameter,
                                    extend_schema)
+from redis.asyncio.client import PubSub as AsyncPubSub
 from rest_framework import status
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from .caching import cache_get, cache_set
+from .events import close_subscription, format_event, job_payload, subscribe
 from .models import Job
-from .serializers import JobCreateSerializer
+from .serializers import validate_job_data, validate_job_list
 from .tasks import process_guideline
 
+# Jobs in these states never change again, so their detail responses can be
+# served from the cache instead of the database
+TERMINAL_STATUSES = ("done", "failed")
+JOB_DETAIL_CACHE_TIMEOUT = 60 * 60
 
-class JobCreateView(APIView):
-    """
-    API view for creating new guideline processing jobs.
+# Send an SSE comment this often so proxies don't close an idle event stream
+JOB_EVENTS_KEEPALIVE_INTERVAL = 15
+# Close event streams after this long so each Redis subscription is
+# eventually released; EventSource clients reconnect automatically after
+# JOB_EVENTS_RETRY_MS
+JOB_EVENTS_MAX_DURATION = 10 * 60
+JOB_EVENTS_RETRY_MS = 3000
 
-    Accepts guideline text and optionally a title, creates a job record,
-    and queues it for processing by Celery workers.
-    """
+# OpenAPI schema for the job endpoints, built once at import and shared by
+# both views
+_EXAMPLE_EVENT_ID = "123e4567-e89b-12d3-a456-426614174000"
 
-    @extend_schema(
-        summary="Create a new guideline processing job",
-        description="Creates a new job to process clinical guidelines using GPT. Returns an event_id for tracking.",
-        request={
-            "application/json": {
-                "type": "object",
-                "properties": {
-                    "title": {
-                        "type": "string",
-                        "description": "Optional title for the guideline",
-                    },
-                    "guideline_text": {
-                        "type": "string",
-                        "description": "The clinical guideline text to process",
-                    },
-                },
-                "required": ["guideline_text"],
-            }
+_EVENT_ID_PROPERTY = {
+    "type": "string",
+    "format": "uuid",
+    "description": "Unique identifier for the job",
+}
+
+_JOB_INPUT = {
+    "type": "object",
+    "properties": {
+        "title": {
+            "type": "string",
+            "description": "Optional title for the guideline",
         },
-        responses={
-            202: {
-                "description": "Job created successfully",
-                "type": "object",
-                "properties": {
-                    "event_id": {
-                        "type": "string",
-                        "format": "uuid",
-                        "description": "Unique identifier for the job",
-                    }
+        "guideline_text": {
+            "type": "string",
+            "description": "The clinical guideline text to process",
+        },
+    },
+    "required": ["guideline_text"],
+}
+
+_EVENT_ID_PARAMETER = OpenApiParameter(
+    name="event_id",
+    location=OpenApiParameter.PATH,
+    description="Unique identifier for the job",
+    required=True,
+    type=str,
+)
+
+_NOT_FOUND_RESPONSE = {
+    "description": "Job not found",
+    "type": "object",
+    "properties": {"error": {"type": "string", "description": "Error message"}},
+}
+
+
+def _field_errors(field: str) -> Dict[str, Any]:
+    """Schema for the list of validation messages reported for one field."""
+    return {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": f"Validation errors for {field} field",
+    }
+
+
+_CREATE_SCHEMA: Dict[str, Any] = {
+    "summary": "Create a new guideline processing job",
+    "description": "Creates a new job to process clinical guidelines using GPT. Returns an event_id for tracking.",
+    "request": {
+        "application/json": {
+            "oneOf": [
+                _JOB_INPUT,
+                {
+                    "type": "array",
+                    "description": "Up to 100 guidelines to create as separate jobs",
+                    "items": _JOB_INPUT,
                 },
-            },
-            400: {
-                "description": "Bad request - validation errors",
-                "type": "object",
-                "properties": {
-                    "guideline_text": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Validation errors for guideline_text field"
-                    },
-                    "title": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Validation errors for title field"
-                    }
+            ]
+        }
+    },
+    "responses": {
+        202: {
+            "description": "Job created successfully",
+            "type": "object",
+            "properties": {
+                "event_id": _EVENT_ID_PROPERTY,
+                "event_ids": {
+                    "type": "array",
+                    "items": {"type": "string", "format": "uuid"},
+                    "description": "Job identifiers, in request order (list requests only)",
                 },
-                "example": {
-                    "guideline_text": ["This field is required."]
-                }
             },
         },
-        examples=[
-            OpenApiExample(
-                "Valid Request",
-                value={
+        400: {
+            "description": "Bad request - validation errors",
+            "type": "object",
+            "properties": {
+                "guideline_text": _field_errors("guideline_text"),
+                "title": _field_errors("title"),
+            },
+            "example": {"guideline_text": ["This field is required."]},
+        },
+    },
+    "examples": [
+        OpenApiExample(
+            "Valid Request",
+            value={
+                "title": "Diabetes Management Guidelines",
+                "guideline_text": "Patients with diabetes should monitor blood glucose daily...",
+            },
+            request_only=True,
+        ),
+        OpenApiExample(
+            "Bulk Request",
+            value=[
+                {
                     "title": "Diabetes Management Guidelines",
                     "guideline_text": "Patients with diabetes should monitor blood glucose daily...",
                 },
-                request_only=True,
-            ),
-            OpenApiExample(
-                "Success Response",
-                value={"event_id": "123e4567-e89b-12d3-a456-426614174000"},
-                response_only=True,
-            ),
-        ],
-    )
+                {
+                    "guideline_text": "Adults should have their blood pressure checked yearly...",
+                },
+            ],
+            request_only=True,
+        ),
+        OpenApiExample(
+            "Success Response",
+            value={"event_id": _EXAMPLE_EVENT_ID},
+            response_only=True,
+        ),
+    ],
+}
+
+_DETAIL_SCHEMA: Dict[str, Any] = {
+    "summary": "Get job status and results",
+    "description": "Retrieves the current status and results of a guideline processing job.",
+    "parameters": [_EVENT_ID_PARAMETER],
+    "responses": {
+        200: {
+            "description": "Job details retrieved successfully",
+            "type": "object",
+            "properties": {
+                "event_id": _EVENT_ID_PROPERTY,
+                "status": {
+                    "type": "string",
+                    "enum": ["queued", "processing", "done", "failed"],
+                    "description": "Current job status",
+                },
+                "summary": {
+                    "type": "string",
+                    "description": "Generated summary (only when status is done)",
+                },
+                "checklist": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Generated checklist (only when status is done)",
+                },
+            },
+        },
+        404: _NOT_FOUND_RESPONSE,
+    },
+    "examples": [
+        OpenApiExample(
+            "Queued Job",
+            value={"event_id": _EXAMPLE_EVENT_ID, "status": "queued"},
+            response_only=True,
+        ),
+        OpenApiExample(
+            "Completed Job",
+            value={
+                "event_id": _EXAMPLE_EVENT_ID,
+                "status": "done",
+                "summary": "This guideline outlines diabetes management protocols...",
+                "checklist": [
+                    "Monitor blood glucose daily",
+                    "Take medications as prescribed",
+                    "Schedule regular checkups",
+                ],
+            },
+            response_only=True,
+        ),
+    ],
+}
+
+
+class JobCreateView(APIView):
+    """
+    API view for creating new guideline processing jobs.
+
+    Accepts guideline text and optionally a title, creates a job record,
+    and queues it for processing by Celery workers. A list of such objects
+    creates one job per item in a single bulk INSERT.
+    """
+
+    @extend_schema(**_CREATE_SCHEMA)
     def post(self, request: Request) -> Response:
         """
         Create a new guideline processing job.
@@ -98,26 +225,75 @@ class JobCreateView(APIView):
         Returns:
             Response with event_id on success, or validation errors on failure
         """
-        serializer = JobCreateSerializer(data=request.data)
-        if not serializer.is_valid():
-            return Response(serializer.errors, status=400)
+        if isinstance(request.data, list):
+            return self._create_many(request.data)
+
+        validated_data, errors = validate_job_data(request.data)
+        if errors:
+            return Response(errors, status=400)
+
+        title: str = validated_data.get("title")
+        guideline_text: str = validated_data["guideline_text"]
+
+        # A single INSERT is already atomic. In autocommit mode on_commit runs
+        # the dispatch right after it commits; inside an outer transaction it
+        # still waits for that transaction to commit.
+        job = Job.objects.create(
+            title=title or "Untitled Guideline",
+            guideline_text=guideline_text,
+            status="queued",
+        )
+        # Publish once, without kombu's blocking retry loop, and let a broker
+        # failure be logged rather than turn an already-created job into a 500
+        transaction.on_commit(
+            lambda: process_guideline.apply_async((job.event_id,), retry=False),
+            robust=True,
+        )
+
+        # Stringify once here so the JSON renderer sees a plain str rather
+        # than falling back to its UUID encoder
+        return Response({"event_id": str(job.event_id)}, status=202)
+
+    def _create_many(self, items: List[Any]) -> Response:
+        """
+        Create and queue one job per item of a list request body.
 
-        title: str = serializer.validated_data.get("title")
-        guideline_text: str = serializer.validated_data["guideline_text"]
+        All items are validated before anything is written, so a request
+        either creates every job or none of them.
 
-        with transaction.atomic():
-            job = Job.objects.create(
-                title=title or "Untitled Guideline",
-                guideline_text=guideline_text,
-                status="queued",
-            )
+        Args:
+            items: The parsed list request body
 
-            def launch_task() -> None:
-                process_guideline.delay(str(job.event_id))
+        Returns:
+            Response with the event_ids in request order on success, or
+            per-item validation errors on failure
+        """
+        validated_items, errors = validate_job_list(items)
+        if errors:
+            return Response(errors, status=400)
 
-            transaction.on_commit(launch_task)
+        # bulk_create issues a single INSERT for the whole batch; event_id is
+        # generated client-side, so the ids are known without a read-back
+        jobs = Job.objects.bulk_create(
+            [
+                Job(
+                    title=item.get("title") or "Untitled Guideline",
+                    guideline_text=item["guideline_text"],
+                    status="queued",
+                )
+                for item in validated_items
+            ]
+        )
+        # A group publishes all messages over one producer connection while
+        # keeping one task per job, so the jobs still run in parallel
+        signatures = group([process_guideline.s(job.event_id) for job in jobs])
+        transaction.on_commit(
+            lambda: signatures.apply_async(retry=False), robust=True
+        )
 
-        return Response({"event_id": job.event_id}, status=202)
+        return Response(
+            {"event_ids": [str(job.event_id) for job in jobs]}, status=202
+        )
 
 
 class JobDetailView(APIView):
@@ -128,77 +304,7 @@ class JobDetailView(APIView):
     identified by its event_id.
     """
 
-    @extend_schema(
-        summary="Get job status and results",
-        description="Retrieves the current status and results of a guideline processing job.",
-        parameters=[
-            OpenApiParameter(
-                name="event_id",
-                location=OpenApiParameter.PATH,
-                description="Unique identifier for the job",
-                required=True,
-                type=str,
-            )
-        ],
-        responses={
-            200: {
-                "description": "Job details retrieved successfully",
-                "type": "object",
-                "properties": {
-                    "event_id": {
-                        "type": "string",
-                        "format": "uuid",
-                        "description": "Unique identifier for the job",
-                    },
-                    "status": {
-                        "type": "string",
-                        "enum": ["queued", "processing", "done", "failed"],
-                        "description": "Current job status",
-                    },
-                    "summary": {
-                        "type": "string",
-                        "description": "Generated summary (only when status is done)",
-                    },
-                    "checklist": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Generated checklist (only when status is done)",
-                    },
-                },
-            },
-            404: {
-                "description": "Job not found",
-                "type": "object",
-                "properties": {
-                    "error": {"type": "string", "description": "Error message"}
-                },
-            },
-        },
-        examples=[
-            OpenApiExample(
-                "Queued Job",
-                value={
-                    "event_id": "123e4567-e89b-12d3-a456-426614174000",
-                    "status": "queued",
-                },
-                response_only=True,
-            ),
-            OpenApiExample(
-                "Completed Job",
-                value={
-                    "event_id": "123e4567-e89b-12d3-a456-426614174000",
-                    "status": "done",
-                    "summary": "This guideline outlines diabetes management protocols...",
-                    "checklist": [
-                        "Monitor blood glucose daily",
-                        "Take medications as prescribed",
-                        "Schedule regular checkups",
-                    ],
-                },
-                response_only=True,
-            ),
-        ],
-    )
+    @extend_schema(**_DETAIL_SCHEMA)
     def get(self, request: Request, event_id: str) -> Response:
         """
         Retrieve job status and results.
@@ -210,16 +316,137 @@ class JobDetailView(APIView):
         Returns:
             Response with job details on success, or 404 if job not found
         """
-        try:
-            job = Job.objects.get(event_id=event_id)
-        except Job.DoesNotExist:
-            return Response({"error": "Job not found"}, status=404)
+        cache_key = f"job:{event_id}"
+        # A cache error reads as a miss, so polls fall through to Postgres
+        payload = cache_get(cache_key)
+        if payload is not None:
+            return Response(payload)
 
-        return Response(
-            {
-                "event_id": str(job.event_id),
-                "status": job.status,
-                "summary": job.summary,
-                "checklist": job.checklist,
-            }
+        # Fetch the response columns as a dict; polling doesn't need a Job
+        # instance or the (potentially large) guideline_text. first() reports
+        # a miss as None instead of raising, which keeps 404s for stale ids
+        # off the exception path.
+        job = (
+            Job.objects.filter(event_id=event_id)
+            .values("event_id", "status", "summary", "checklist")
+            .first()
         )
+        if job is None:
+            return Response({"error": "Job not found"}, status=404)
+
+        payload = job_payload(**job)
+        if payload["status"] in TERMINAL_STATUSES:
+            cache_set(cache_key, payload, timeout=JOB_DETAIL_CACHE_TIMEOUT)
+
+        return Response(payload)
+
+
+class JobEventsView(View):
+    """
+    Async view streaming job status changes as Server-Sent Events.
+
+    Lets clients wait for a result without polling JobDetailView: the
+    worker publishes each status change to Redis and this view relays it.
+    DRF has no async views, so this is a plain Django view; its OpenAPI
+    entry is added by jobs.schema.add_job_events_path.
+
+    Streams are only held open under ASGI (the events service), where an
+    idle stream costs a coroutine rather than a request thread. Under WSGI
+    the view sends the current state and closes, and the client's
+    EventSource reconnects after JOB_EVENTS_RETRY_MS.
+    """
+
+    async def get(
+        self, request: HttpRequest, event_id: uuid.UUID
+    ) -> Union[JsonResponse, StreamingHttpResponse]:
+        """
+        Stream a job's status changes.
+
+        Args:
+            request: The HTTP request
+            event_id: The unique identifier of the job
+
+        Returns:
+            A text/event-stream response, or 404 if job not found
+        """
+        # Subscribe before reading the row so a change published in between
+        # still reaches the client
+        pubsub = None
+        if isinstance(request, ASGIRequest):
+            pubsub = await subscribe(event_id)
+        job = await _fetch_job_state(event_id)
+        if job is None:
+            if pubsub is not None:
+                await close_subscription(pubsub)
+            return JsonResponse({"error": "Job not found"}, status=404)
+
+        payload = job_payload(**job)
+        if pubsub is None:
+            # A finite, synchronous body, so WSGI doesn't buffer an async one
+            content = [f"retry: {JOB_EVENTS_RETRY_MS}\n\n", format_event(payload)]
+        else:
+            content = self._stream(payload, pubsub)
+
+        response = StreamingHttpResponse(content, content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        # Stop nginx from buffering the stream
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    async def _stream(
+        self, payload: Dict[str, Any], pubsub: AsyncPubSub
+    ) -> AsyncIterator[str]:
+        """
+        Yield the event stream for one job.
+
+        Args:
+            payload: The job's current state
+            pubsub: A PubSub subscribed to the job's channel
+
+        Yields:
+            Server-Sent Events messages
+        """
+        try:
+            yield f"retry: {JOB_EVENTS_RETRY_MS}\n\n"
+            yield format_event(payload)
+            if payload["status"] in TERMINAL_STATUSES:
+                return
+
+            deadline = time.monotonic() + JOB_EVENTS_MAX_DURATION
+            while time.monotonic() < deadline:
+                message = await pubsub.get_message(
+                    timeout=JOB_EVENTS_KEEPALIVE_INTERVAL
+                )
+                if message is None:
+                    yield ": keepalive\n\n"
+                    continue
+
+                payload = json.loads(message["data"])
+                yield format_event(payload)
+                if payload["status"] in TERMINAL_STATUSES:
+                    return
+        finally:
+            await close_subscription(pubsub)
+
+
+@sync_to_async
+def _fetch_job_state(event_id: uuid.UUID) -> Optional[Dict[str, Any]]:
+    """
+    Read a job's response columns for JobEventsView.
+
+    Args:
+        event_id: The unique identifier of the job
+
+    Returns:
+        The job's event_id, status, summary and checklist, or None if job
+        not found
+    """
+    job = (
+        Job.objects.filter(event_id=event_id)
+        .values("event_id", "status", "summary", "checklist")
+        .first()
+    )
+    # Don't hold a pooled database connection for the life of the stream
+    if not connection.in_atomic_block:
+        connection.close()
+    return job